@@ -3,13 +3,67 @@ import mesop as me
 from state.state import AppState, StateMessage
 
 
+_BUBBLE_SHADOW = (
+    '0 1px 2px 0 rgba(60, 64, 67, 0.3), 0 1px 3px 1px rgba(60, 64, 67, 0.15)'
+)
+
+# Styles are built once at import; Mesop re-renders the whole tree on every
+# state change and chat_box runs for every content part of every message.
+_ROW_STYLE_SPACED = me.Style(
+    display='flex', justify_content='space-between', min_width=500
+)
+_ROW_STYLE_END = me.Style(display='flex', justify_content='end', min_width=500)
+_COLUMN_STYLE = me.Style(display='flex', flex_direction='column', gap=5)
+_IMAGE_STYLE = me.Style(width='50%', object_fit='contain')
+
+
+def _bubble_style(background: str) -> me.Style:
+    return me.Style(
+        font_family='Google Sans',
+        box_shadow=_BUBBLE_SHADOW,
+        padding=me.Padding(top=1, left=15, right=15, bottom=1),
+        margin=me.Margin(top=5, left=0, right=0, bottom=5),
+        background=background,
+        border_radius=15,
+    )
+
+
+_BUBBLE_STYLE_PRIMARY = _bubble_style(me.theme_var('primary-container'))
+_BUBBLE_STYLE_SECONDARY = _bubble_style(me.theme_var('secondary-container'))
+_PROGRESS_TEXT_STYLE = me.Style(
+    padding=me.Padding(top=1, left=15, right=15, bottom=1),
+    margin=me.Margin(top=5, left=0, right=0, bottom=5),
+)
+
+
+def _render_image(content: str, role: str) -> None:
+    if '/message/file' not in content:
+        content = 'data:image/png;base64,' + content
+    me.image(src=content, style=_IMAGE_STYLE)
+
+
+def _render_markdown(content: str, role: str) -> None:
+    me.markdown(
+        content,
+        style=(
+            _BUBBLE_STYLE_PRIMARY if role == 'user' else _BUBBLE_STYLE_SECONDARY
+        ),
+    )
+
+
+# Media types with a dedicated renderer; anything else is shown as markdown.
+_CONTENT_RENDERERS = {
+    'image/png': _render_image,
+}
+
+
 @me.component
 def chat_bubble(message: StateMessage, key: str):
     """Chat bubble component"""
     app_state = me.state(AppState)
     show_progress_bar = (
         message.message_id in app_state.background_tasks
-        or message.message_id in app_state.message_aliases.values()
+        or message.message_id in app_state.message_alias_targets
     )
     progress_text = ''
     if show_progress_bar:
@@ -36,83 +90,26 @@ def chat_box(
     progress_text: str,
 ):
     with me.box(
-        style=me.Style(
-            display='flex',
-            justify_content=('space-between' if role == 'agent' else 'end'),
-            min_width=500,
-        ),
+        style=_ROW_STYLE_SPACED if role == 'agent' else _ROW_STYLE_END,
         key=key,
     ):
-        with me.box(
-            style=me.Style(display='flex', flex_direction='column', gap=5)
-        ):
-            if media_type == 'image/png':
-                if '/message/file' not in content:
-                    content = 'data:image/png;base64,' + content
-                me.image(
-                    src=content,
-                    style=me.Style(
-                        width='50%',
-                        object_fit='contain',
-                    ),
-                )
-            else:
-                me.markdown(
-                    content,
-                    style=me.Style(
-                        font_family='Google Sans',
-                        box_shadow=(
-                            '0 1px 2px 0 rgba(60, 64, 67, 0.3), '
-                            '0 1px 3px 1px rgba(60, 64, 67, 0.15)'
-                        ),
-                        padding=me.Padding(top=1, left=15, right=15, bottom=1),
-                        margin=me.Margin(top=5, left=0, right=0, bottom=5),
-                        background=(
-                            me.theme_var('primary-container')
-                            if role == 'user'
-                            else me.theme_var('secondary-container')
-                        ),
-                        border_radius=15,
-                    ),
-                )
+        with me.box(style=_COLUMN_STYLE):
+            render = _CONTENT_RENDERERS.get(media_type, _render_markdown)
+            render(content, role)
     if progress_bar:
         with me.box(
-            style=me.Style(
-                display='flex',
-                justify_content=('space-between' if role == 'user' else 'end'),
-                min_width=500,
-            ),
+            style=_ROW_STYLE_SPACED if role == 'user' else _ROW_STYLE_END,
             key=key,
         ):
-            with me.box(
-                style=me.Style(display='flex', flex_direction='column', gap=5)
-            ):
+            with me.box(style=_COLUMN_STYLE):
                 with me.box(
-                    style=me.Style(
-                        font_family='Google Sans',
-                        box_shadow=(
-                            '0 1px 2px 0 rgba(60, 64, 67, 0.3), '
-                            '0 1px 3px 1px rgba(60, 64, 67, 0.15)'
-                        ),
-                        padding=me.Padding(top=1, left=15, right=15, bottom=1),
-                        margin=me.Margin(top=5, left=0, right=0, bottom=5),
-                        background=(
-                            me.theme_var('primary-container')
-                            if role == 'agent'
-                            else me.theme_var('secondary-container')
-                        ),
-                        border_radius=15,
+                    style=(
+                        _BUBBLE_STYLE_PRIMARY
+                        if role == 'agent'
+                        else _BUBBLE_STYLE_SECONDARY
                     ),
                 ):
                     if not progress_text:
                         progress_text = 'Working...'
-                    me.text(
-                        progress_text,
-                        style=me.Style(
-                            padding=me.Padding(
-                                top=1, left=15, right=15, bottom=1
-                            ),
-                            margin=me.Margin(top=5, left=0, right=0, bottom=5),
-                        ),
-                    )
+                    me.text(progress_text, style=_PROGRESS_TEXT_STYLE)
                     me.progress_bar(color='accent')
@@ -161,6 +161,7 @@ async def UpdateAppState(state: AppState, conversation_id: str):
             )
         state.background_tasks = await GetProcessingMessages()
         state.message_aliases = GetMessageAliases()
+        state.message_alias_targets = set(state.message_aliases.values())
     except Exception as e:
         print('Failed to update state: ', e)
         traceback.print_exc(file=sys.stdout)
@@ -82,6 +82,8 @@ class AppState:
     task_list: list[SessionTask] = dataclasses.field(default_factory=list)
     background_tasks: dict[str, str] = dataclasses.field(default_factory=dict)
     message_aliases: dict[str, str] = dataclasses.field(default_factory=dict)
+    # Values of message_aliases, kept as a set for O(1) lookups while rendering
+    message_alias_targets: set[str] = dataclasses.field(default_factory=set)
     # This is used to track the data entered in a form
     completed_forms: dict[str, dict[str, Any] | None] = dataclasses.field(
         default_factory=dict
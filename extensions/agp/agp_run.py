@@ -1,4 +1,5 @@
 import logging
+import sys
 
 from agp_protocol import (
     AGPTable,
@@ -8,8 +9,14 @@ from agp_protocol import (
 )
 
 
-# Set logging level to WARNING so only our custom routing failures are visible
-logging.basicConfig(level=logging.WARNING)
+# Capability names and policy keys are shared by every announcement and
+# intent below, so intern them once and reuse the same objects throughout.
+CAP_VM = sys.intern('infra:provision:vm')
+CAP_FINANCE = sys.intern('financial_analysis:quarterly')
+CAP_HR_ONBOARD = sys.intern('hr:onboard:new_hire')
+POL_SECURITY_LEVEL = sys.intern('security_level')
+POL_REQUIRES_PII = sys.intern('requires_PII')
+POL_GEO = sys.intern('geo')
 
 
 def run_simulation():
@@ -36,10 +43,10 @@ def run_simulation():
     # --- Announcement 1: Engineering Squad (Internal, Secure) ---
     # Can provision VMs, handles sensitive data (PII), but is more expensive than the external vendor.
     eng_announcement = CapabilityAnnouncement(
-        capability='infra:provision:vm',
+        capability=CAP_VM,
         version='1.0',
         cost=0.10,  # Higher cost
-        policy={'security_level': 5, 'requires_PII': True},
+        policy={POL_SECURITY_LEVEL: 5, POL_REQUIRES_PII: True},
     )
     corporate_gateway.announce_capability(
         eng_announcement, path='Squad_Engineering/vm_provisioner'
@@ -48,10 +55,10 @@ def run_simulation():
     # --- Announcement 2: External Vendor Squad (Cheapest, Low Security) ---
     # Can provision VMs, but fails the PII check and only meets standard security.
     vendor_announcement = CapabilityAnnouncement(
-        capability='infra:provision:vm',
+        capability=CAP_VM,
         version='1.1',
         cost=0.05,  # Lowest cost
-        policy={'security_level': 3, 'requires_PII': False},
+        policy={POL_SECURITY_LEVEL: 3, POL_REQUIRES_PII: False},
     )
     corporate_gateway.announce_capability(
         vendor_announcement, path='External_Vendor/vm_provisioning_api'
@@ -59,10 +66,10 @@ def run_simulation():
 
     # --- Announcement 3: Finance Squad (Standard Analysis) ---
     finance_announcement = CapabilityAnnouncement(
-        capability='financial_analysis:quarterly',
+        capability=CAP_FINANCE,
         version='2.0',
         cost=0.15,
-        policy={'security_level': 3, 'geo': 'US'},
+        policy={POL_SECURITY_LEVEL: 3, POL_GEO: 'US'},
     )
     corporate_gateway.announce_capability(
         finance_announcement, path='Squad_Finance/analysis_tool'
@@ -75,9 +82,9 @@ def run_simulation():
     # Intent A: Standard VM provisioning (Cost-driven, minimal policy)
     # Expected: Route to External Vendor (Cost: 0.05) because it's cheapest and complies with security_level: 3.
     intent_a = IntentPayload(
-        target_capability='infra:provision:vm',
+        target_capability=CAP_VM,
         payload={'type': 'standard', 'user': 'bob'},
-        policy_constraints={'security_level': 3},
+        policy_constraints={POL_SECURITY_LEVEL: 3},
     )
     print(
         '\n[Intent A] Requesting standard VM provisioning (Lowest cost, Security Level 3).'
@@ -88,9 +95,9 @@ def run_simulation():
     # Expected: Route to Engineering Squad (Cost: 0.10) because the External Vendor (0.05) fails the PII policy.
     # The router uses the sufficiency check (5 >= 5 is True).
     intent_b = IntentPayload(
-        target_capability='infra:provision:vm',
+        target_capability=CAP_VM,
         payload={'type': 'sensitive', 'user': 'alice', 'data': 'ssn_data'},
-        policy_constraints={'security_level': 5, 'requires_PII': True},
+        policy_constraints={POL_SECURITY_LEVEL: 5, POL_REQUIRES_PII: True},
     )
     print(
         '\n[Intent B] Requesting sensitive VM provisioning (Requires PII and Security Level 5).'
@@ -100,9 +107,9 @@ def run_simulation():
     # Intent C: Requesting provisioning with security level 7 (Unmatched Policy)
     # Expected: Fails because no announced route can satisfy level 7.
     intent_c = IntentPayload(
-        target_capability='infra:provision:vm',
+        target_capability=CAP_VM,
         payload={'type': 'max_security'},
-        policy_constraints={'security_level': 7},
+        policy_constraints={POL_SECURITY_LEVEL: 7},
     )
     print(
         '\n[Intent C] Requesting provisioning with security level 7 (Unmatched Policy).'
@@ -112,7 +119,7 @@ def run_simulation():
     # Intent D: Requesting HR onboarding (Unknown Capability)
     # Expected: Fails because the capability was never announced.
     intent_d = IntentPayload(
-        target_capability='hr:onboard:new_hire',
+        target_capability=CAP_HR_ONBOARD,
         payload={'employee': 'Charlie'},
         policy_constraints={},
     )
@@ -121,4 +128,8 @@ def run_simulation():
 
 
 if __name__ == '__main__':
+    # Log at INFO so gateway announcements and routing results are visible
+    logging.basicConfig(
+        level=logging.INFO, format='%(message)s', stream=sys.stdout
+    )
     run_simulation()
@@ -1,10 +1,14 @@
 import logging
+import sys
 
 from typing import Any, Optional
 
 from pydantic import BaseModel, ConfigDict, Field
 
 
+# Get a module-level logger instance
+logger = logging.getLogger(__name__)
+
 # --- Core Data Structures ---
 
 
@@ -86,21 +90,75 @@ class AgentGatewayProtocol:
         self, announcement: CapabilityAnnouncement, path: str
     ):
         """Simulates receiving a capability announcement and updating the AGP Table."""
-        entry = RouteEntry(
+        # The announcement has already been validated, so skip re-validation.
+        # Policy keys and the capability key are interned so lookups with
+        # interned strings (e.g. source literals) match on identity before
+        # falling back to a full string compare.
+        entry = RouteEntry.model_construct(
             path=path,
             cost=announcement.cost or 0.0,
-            policy=announcement.policy,
+            policy={
+                sys.intern(key): value
+                for key, value in announcement.policy.items()
+            },
         )
 
-        capability_key = announcement.capability
+        capability_key = sys.intern(announcement.capability)
 
         # Use setdefault to initialize the list if the key is new
         self.agp_table.routes.setdefault(capability_key, []).append(entry)
 
-        print(
-            f'[{self.squad_name}] ANNOUNCED: {capability_key} routed via {path}'
+        logger.info(
+            '[%s] ANNOUNCED: %s routed via %s',
+            self.squad_name,
+            capability_key,
+            path,
         )
 
+    @staticmethod
+    def _split_constraints(
+        constraints: dict[str, Any],
+    ) -> tuple[Optional[float], tuple[tuple[str, Any], ...]]:
+        """Splits a numeric 'security_level' minimum from exact-match constraints.
+
+        Done once per intent so the per-route check does not re-test every
+        constraint key against 'security_level'.
+        """
+        min_level = constraints.get('security_level')
+        if isinstance(min_level, (int, float)):
+            exact = tuple(
+                item
+                for item in constraints.items()
+                if item[0] != 'security_level'
+            )
+            return min_level, exact
+        return None, tuple(constraints.items())
+
+    @staticmethod
+    def _policy_satisfies(
+        policy: dict[str, Any],
+        min_level: Optional[float],
+        exact_constraints: tuple[tuple[str, Any], ...],
+    ) -> bool:
+        """Checks a route policy against the split intent constraints.
+
+        'security_level' is a sufficiency check (>=) when both sides are
+        numeric; every other constraint must match exactly.
+        """
+        if min_level is not None:
+            if 'security_level' not in policy:
+                return False
+            announced = policy['security_level']
+            if isinstance(announced, (int, float)):
+                if not announced >= min_level:
+                    return False
+            elif announced != min_level:
+                return False
+        for key, value in exact_constraints:
+            if key not in policy or policy[key] != value:
+                return False
+        return True
+
     # Private method containing the core, *unmodified* routing logic
     def __select_best_route(
         self, intent: IntentPayload
@@ -111,40 +169,42 @@ class AgentGatewayProtocol:
         target_cap = intent.target_capability
         intent_constraints = intent.policy_constraints
 
-        if target_cap not in self.agp_table.routes:
-            logging.warning(
-                f"[{self.squad_name}] ROUTING FAILED: Capability '{target_cap}' is unknown."
+        possible_routes = self.agp_table.routes.get(target_cap)
+        if possible_routes is None:
+            logger.warning(
+                "[%s] ROUTING FAILED: Capability '%s' is unknown.",
+                self.squad_name,
+                target_cap,
             )
             return None
 
-        possible_routes = self.agp_table.routes[target_cap]
-
-        # --- 2. Policy Filtering (Optimized using list comprehension and all()) ---
-        compliant_routes = [
-            route
-            for route in possible_routes
-            if all(
-                key in route.policy
-                and (
-                    route.policy[key] >= value
-                    if key == 'security_level'
-                    and isinstance(route.policy.get(key), (int, float))
-                    and isinstance(value, (int, float))
-                    else route.policy[key] == value
+        min_level, exact_constraints = self._split_constraints(
+            intent_constraints
+        )
+
+        # --- 2. Policy Filtering and Best Route Selection (Lowest Cost) ---
+        # Filter lazily so min() scans the routes once without building an
+        # intermediate list of compliant routes.
+        best_route = min(
+            (
+                route
+                for route in possible_routes
+                if self._policy_satisfies(
+                    route.policy, min_level, exact_constraints
                 )
-                for key, value in intent_constraints.items()
-            )
-        ]
+            ),
+            key=lambda r: r.cost,
+            default=None,
+        )
 
-        if not compliant_routes:
-            logging.warning(
-                f'[{self.squad_name}] ROUTING FAILED: No compliant route found for constraints: {intent_constraints}'
+        if best_route is None:
+            logger.warning(
+                '[%s] ROUTING FAILED: No compliant route found for constraints: %s',
+                self.squad_name,
+                intent_constraints,
             )
             return None
 
-        # --- 3. Best Route Selection (Lowest Cost) ---
-        best_route = min(compliant_routes, key=lambda r: r.cost)
-
         return best_route
 
     # Public, overridable method for core routing logic (used by external components)
@@ -158,12 +218,16 @@ class AgentGatewayProtocol:
     # Public method that is typically called by the A2A endpoint (includes side effects)
     def route_intent(self, intent: IntentPayload) -> Optional[RouteEntry]:
         """
-        Public entry point for routing an Intent payload, including printing side effects.
+        Public entry point for routing an Intent payload, including logging side effects.
         """
         best_route = self.__select_best_route(intent)
 
         if best_route:
-            print(
-                f"[{self.squad_name}] ROUTING SUCCESS: Intent for '{intent.target_capability}' routed to {best_route.path} (Cost: {best_route.cost})"
+            logger.info(
+                "[%s] ROUTING SUCCESS: Intent for '%s' routed to %s (Cost: %s)",
+                self.squad_name,
+                intent.target_capability,
+                best_route.path,
+                best_route.cost,
             )
         return best_route
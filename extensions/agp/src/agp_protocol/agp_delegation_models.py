@@ -1,5 +1,6 @@
 import logging
 
+from collections.abc import Iterator
 from typing import Any
 
 from pydantic import BaseModel, ConfigDict, Field
@@ -9,8 +10,10 @@ from pydantic import BaseModel, ConfigDict, Field
 logger = logging.getLogger(__name__)
 
 # NOTE: Since this file is now in the src/agp_protocol package,
-# we use relative import to pull necessary classes from the sibling file (__init__.py).
-from .__init__ import (
+# we use relative import to pull necessary classes from the package itself.
+# Importing from '.__init__' would load the package body a second time as a
+# separate module and define duplicate model classes.
+from . import (
     AgentGatewayProtocol,
     IntentPayload,
 )
@@ -76,18 +79,42 @@ class DelegationRouter:
         """
         # Replaced print() statements with logger.info()
         logger.info(
-            f"\n[{self.squad_name}] RECEIVED DELEGATION: '{delegation_intent.meta_task}' from {delegation_intent.origin_squad}"
+            "\n[%s] RECEIVED DELEGATION: '%s' from %s",
+            self.squad_name,
+            delegation_intent.meta_task,
+            delegation_intent.origin_squad,
         )
         logger.info(
             '--------------------------------------------------------------------------------'
         )
 
-        results = {}
+        results = dict(self.iter_delegation_results(delegation_intent))
+
+        logger.info(
+            '--------------------------------------------------------------------------------'
+        )
+        logger.info(
+            '[%s] DELEGATION COMPLETE: Processed %d sub-tasks.',
+            self.squad_name,
+            len(results),
+        )
+        return results
+
+    def iter_delegation_results(
+        self, delegation_intent: DelegationIntent
+    ) -> Iterator[tuple[str, str]]:
+        """Routes each SubIntent, yielding (target_capability, status) pairs.
+
+        Lets large delegations be consumed as a stream instead of being
+        collected into a results dict first.
+        """
+        total = len(delegation_intent.sub_intents)
 
         for i, sub_intent_data in enumerate(delegation_intent.sub_intents):
             # --- CRITICAL DECOMPOSITION STEP ---
-            # Synthesize a simple AGP IntentPayload from the SubIntent data
-            sub_intent = IntentPayload(
+            # Synthesize a simple AGP IntentPayload from the SubIntent data.
+            # SubIntent was validated with DelegationIntent, so skip re-validation.
+            sub_intent = IntentPayload.model_construct(
                 target_capability=sub_intent_data.target_capability,
                 payload=sub_intent_data.payload,
                 # Use the correct keyword for the core IntentPayload
@@ -103,17 +130,9 @@ class DelegationRouter:
 
             # Logging the result for each sub-task
             logger.info(
-                f'[{i + 1}/{len(delegation_intent.sub_intents)}] TASK: {sub_intent.target_capability}'
+                '[%d/%d] TASK: %s', i + 1, total, sub_intent.target_capability
             )
-            logger.info(f'    STATUS: {status}')
-            logger.info(f'    ROUTE: {path} (Cost: {cost})')
-
-            results[sub_intent.target_capability] = status
+            logger.info('    STATUS: %s', status)
+            logger.info('    ROUTE: %s (Cost: %s)', path, cost)
 
-        logger.info(
-            '--------------------------------------------------------------------------------'
-        )
-        logger.info(
-            f'[{self.squad_name}] DELEGATION COMPLETE: Processed {len(results)} sub-tasks.'
-        )
-        return results
+            yield sub_intent.target_capability, status
@@ -1,4 +1,5 @@
 import logging
+import sys
 
 from agp_protocol import AGPTable, AgentGatewayProtocol, CapabilityAnnouncement
 from agp_protocol.agp_delegation_models import (
@@ -8,10 +9,6 @@ from agp_protocol.agp_delegation_models import (
 )
 
 
-# Set logging level to WARNING so only our custom routing failures are visible
-logging.basicConfig(level=logging.WARNING)
-
-
 # --- DATA DEFINITION: Centralized Capabilities List ---
 # This list defines all squads and their announced policies and costs in a data-driven structure.
 ENTERPRISE_CAPABILITIES = [
@@ -161,11 +158,12 @@ def run_enterprise_simulation():
 
     logging.info('\n--- 4. Final Aggregation Status ---')
     for task, status in final_status.items():
-        logging.info(f"Task '{task}': {status}")
-
+        logging.info("Task '%s': %s", task, status)
 
-if __name__ == '__main__':
-    run_enterprise_simulation()
 
 if __name__ == '__main__':
+    # Log at INFO so gateway announcements and routing results are visible
+    logging.basicConfig(
+        level=logging.INFO, format='%(message)s', stream=sys.stdout
+    )
     run_enterprise_simulation()
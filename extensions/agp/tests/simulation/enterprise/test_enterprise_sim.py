@@ -1,6 +1,12 @@
+import agp_protocol
 import pytest
 
-from agp_protocol import AGPTable, AgentGatewayProtocol, CapabilityAnnouncement
+from agp_protocol import (
+    AGPTable,
+    AgentGatewayProtocol,
+    CapabilityAnnouncement,
+    agp_delegation_models,
+)
 from agp_protocol.agp_delegation_models import (
     DelegationIntent,
     DelegationRouter,
@@ -253,3 +259,47 @@ def test_05_multi_task_failure_and_partial_success(
 
     # The unknown capability task correctly fails routing (FAILED).
     assert results['unknown:capability'] == 'FAILED'
+
+
+def test_06_delegation_models_share_core_classes():
+    """
+    Verifies the delegation module reuses the package's core classes instead of
+    loading a second copy of the package body.
+    """
+    assert agp_delegation_models.IntentPayload is agp_protocol.IntentPayload
+    assert (
+        agp_delegation_models.AgentGatewayProtocol
+        is agp_protocol.AgentGatewayProtocol
+    )
+
+
+def test_07_streamed_delegation_results(
+    configured_delegation_router: DelegationRouter,
+):
+    """
+    Verifies iter_delegation_results yields one (capability, status) pair per
+    sub-intent, in order, without collecting them first.
+    """
+    delegation_intent = DelegationIntent(
+        meta_task='Streamed Setup',
+        origin_squad='HR',
+        sub_intents=[
+            SubIntent(
+                target_capability='content:draft',
+                payload={'topic': 'Launch'},
+                policy_constraints={'security_level': LEVEL_2},
+            ),
+            SubIntent(
+                target_capability='unknown:capability',
+                payload={'data': 'test'},
+            ),
+        ],
+    )
+
+    results = configured_delegation_router.iter_delegation_results(
+        delegation_intent
+    )
+
+    assert next(results) == ('content:draft', 'SUCCESS')
+    assert next(results) == ('unknown:capability', 'FAILED')
+    assert next(results, None) is None
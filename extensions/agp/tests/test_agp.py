@@ -12,7 +12,7 @@ from agp_protocol import (
 # --- Fixtures for Routing Table Setup ---
 
 
-@pytest.fixture
+@pytest.fixture(scope='module')
 def all_available_routes() -> list[RouteEntry]:
     """Defines a list of heterogeneous routes covering all capabilities needed for testing."""
     return [
@@ -67,7 +67,7 @@ def all_available_routes() -> list[RouteEntry]:
     ]
 
 
-@pytest.fixture
+@pytest.fixture(scope='module')
 def populated_agp_table(all_available_routes) -> AGPTable:
     """Creates an AGPTable populated with routes for all test capabilities."""
     table = AGPTable()
@@ -90,14 +90,28 @@ def populated_agp_table(all_available_routes) -> AGPTable:
     return table
 
 
-@pytest.fixture
+@pytest.fixture(scope='module')
 def gateway(populated_agp_table) -> AgentGatewayProtocol:
-    """Provides a configured Gateway Agent instance for testing."""
+    """Provides a configured Gateway Agent instance shared by read-only routing tests."""
     return AgentGatewayProtocol(
         squad_name='Test_Gateway', agp_table=populated_agp_table
     )
 
 
+@pytest.fixture
+def mutable_gateway(populated_agp_table) -> AgentGatewayProtocol:
+    """Provides a Gateway Agent with its own copy of the table for tests that announce routes."""
+    return AgentGatewayProtocol(
+        squad_name='Test_Gateway',
+        agp_table=AGPTable(
+            routes={
+                capability: list(routes)
+                for capability, routes in populated_agp_table.routes.items()
+            }
+        ),
+    )
+
+
 # --- Test Scenarios (19 Total Tests) ---
 
 
@@ -166,7 +180,9 @@ def test_04_policy_violation_unmatched_constraint(
     assert best_route is None
 
 
-def test_05_announcement_updates_table(gateway: AgentGatewayProtocol):
+def test_05_announcement_updates_table(
+    mutable_gateway: AgentGatewayProtocol,
+):
     """Tests that announce_capability correctly adds a new entry to the AGPTable."""
     announcement = CapabilityAnnouncement(
         capability='test:add:new',
@@ -177,14 +193,14 @@ def test_05_announcement_updates_table(gateway: AgentGatewayProtocol):
     path = 'TestSquad/target'
 
     # Check table before announcement
-    assert 'test:add:new' not in gateway.agp_table.routes
+    assert 'test:add:new' not in mutable_gateway.agp_table.routes
 
-    gateway.announce_capability(announcement, path)
+    mutable_gateway.announce_capability(announcement, path)
 
     # Check table after announcement
-    assert 'test:add:new' in gateway.agp_table.routes
-    assert len(gateway.agp_table.routes['test:add:new']) == 1
-    assert gateway.agp_table.routes['test:add:new'][0].path == path
+    assert 'test:add:new' in mutable_gateway.agp_table.routes
+    assert len(mutable_gateway.agp_table.routes['test:add:new']) == 1
+    assert mutable_gateway.agp_table.routes['test:add:new'][0].path == path
 
 
 def test_06_meta_intent_decomposition(gateway: AgentGatewayProtocol):
@@ -1,5 +1,8 @@
 # run.py
 
+import logging
+import sys
+
 from secure_passport_ext import (
     CallerContext, 
     A2AMessage,             # CORRECTED: Importing the standardized A2AMessage type
@@ -119,6 +122,8 @@ def run_all_samples():
 
 
 if __name__ == "__main__":
+    # The middleware logs its steps at DEBUG; show them alongside the demo output.
+    logging.basicConfig(level=logging.DEBUG, format="%(message)s", stream=sys.stdout)
     run_all_samples()
 
 
@@ -1,7 +1,10 @@
+import logging
 from typing import Optional, Dict, Any, List, Callable
 from pydantic import BaseModel, Field, ValidationError, ConfigDict
 from copy import deepcopy
 
+logger = logging.getLogger(__name__)
+
 # --- Extension Definition ---
 
 SECURE_PASSPORT_URI = "https://github.com/a2aproject/a2a-samples/tree/main/samples/python/extensions/secure-passport"
@@ -44,6 +47,22 @@ def add_secure_passport(message: A2AMessage, context: CallerContext) -> None:
     
     message.metadata[SECURE_PASSPORT_URI] = context.model_dump(by_alias=True, exclude_none=True)
 
+_JSON_SCALARS = (str, int, float, bool, type(None))
+
+def _copy_json(value: Any) -> Any:
+    """
+    Deep-copies JSON-shaped data (dicts, lists, scalars) without the memo and
+    dispatch overhead of copy.deepcopy; anything else falls back to deepcopy.
+    """
+    value_type = type(value)
+    if value_type is dict:
+        return {key: _copy_json(item) for key, item in value.items()}
+    if value_type is list:
+        return [_copy_json(item) for item in value]
+    if value_type in _JSON_SCALARS:
+        return value
+    return deepcopy(value)
+
 def get_secure_passport(message: A2AMessage) -> Optional[CallerContext]:
     """Retrieves and validates the Secure Passport from the message metadata."""
     passport_data = message.metadata.get(SECURE_PASSPORT_URI)
@@ -51,12 +70,21 @@ def get_secure_passport(message: A2AMessage) -> Optional[CallerContext]:
         return None
 
     try:
-        return CallerContext.model_validate(deepcopy(passport_data))
+        passport = CallerContext.model_validate(passport_data)
     except ValidationError as e:
-        import logging
-        logging.warning(f"ERROR: Received malformed Secure Passport data. Ignoring payload: {e}")
+        logger.warning("ERROR: Received malformed Secure Passport data. Ignoring payload: %s", e)
         return None
 
+    # model_validate already builds fresh top-level and state dicts; only the
+    # nested values inside state can still be shared with the message metadata.
+    # Copy just those, and only once the payload is known to be valid. Scalar
+    # values are immutable, so a flat state needs no copying at all.
+    state = passport.state
+    for key, value in state.items():
+        if type(value) not in _JSON_SCALARS:
+            state[key] = _copy_json(value)
+    return passport
+
 # ======================================================================
 # Convenience and Middleware Concepts
 # ======================================================================
@@ -87,7 +115,7 @@ class SecurePassportExtension:
         [Conceptual Middleware Layer: Client/Calling Agent]
         """
         # ACCESS UPDATED: Use context.client_id
-        print(f"[Middleware: Client] Attaching Secure Passport for {context.client_id}")
+        logger.debug("[Middleware: Client] Attaching Secure Passport for %s", context.client_id)
         add_secure_passport(message, context)
         return next_handler(message) 
 
@@ -99,9 +127,9 @@ class SecurePassportExtension:
         passport = get_secure_passport(message)
         
         if passport:
-            print(f"[Middleware: Server] Extracted Secure Passport. Verified: {passport.is_verified}")
+            logger.debug("[Middleware: Server] Extracted Secure Passport. Verified: %s", passport.is_verified)
         else:
-            print("[Middleware: Server] No Secure Passport found or validation failed.")
+            logger.debug("[Middleware: Server] No Secure Passport found or validation failed.")
             
         return next_handler(message, passport)
 
@@ -94,6 +94,24 @@ def test_retrieved_passport_is_immutable_from_message_data(valid_passport_data):
     assert 'new_key' not in original_data
     assert original_data['currency'] == 'USD'
 
+def test_retrieved_passport_nested_state_is_isolated_from_message_data():
+    """Tests that nested containers inside the retrieved state are copies, not shared with the message metadata."""
+    passport = CallerContext(
+        client_id="a2a://marketing-agent.com",
+        state={"time_period": {"start": "2025-07-01"}, "access_scope": ["read:finance_db"]}
+    )
+    message = A2AMessage()
+    add_secure_passport(message, passport)
+
+    retrieved = get_secure_passport(message)
+    retrieved.state['time_period']['start'] = 'changed_value'
+    retrieved.state['access_scope'].append('write:finance_db')
+
+    original_state = message.metadata[SECURE_PASSPORT_URI]['state']
+
+    assert original_state['time_period']['start'] == '2025-07-01'
+    assert original_state['access_scope'] == ['read:finance_db']
+
 
 # ======================================================================
 ## Use Case Integration Tests
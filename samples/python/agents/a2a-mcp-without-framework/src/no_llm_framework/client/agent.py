@@ -26,6 +26,8 @@ from no_llm_framework.client.constant import GOOGLE_API_KEY
 
 dir_path = Path(__file__).parent
 
+json_block_pattern = re.compile(r'```json\n(.*?)\n```', re.DOTALL)
+
 with Path(dir_path / 'decide.jinja').open('r') as f:
     decide_template = Template(f.read())
 
@@ -142,8 +144,7 @@ class Agent:
         Args:
             response (str): The response from the LLM.
         """
-        pattern = r'```json\n(.*?)\n```'
-        match = re.search(pattern, response, re.DOTALL)
+        match = json_block_pattern.search(response)
         if match:
             return json.loads(match.group(1))
         return []
@@ -19,6 +19,13 @@ from google.genai import types as genai_types
 
 logger = logging.getLogger(__name__)
 
+# Fenced blocks the model may wrap its answer in, tried in order.
+RESPONSE_BLOCK_PATTERNS = (
+    re.compile(r'```\n(.*?)\n```', re.DOTALL),
+    re.compile(r'```json\s*(.*?)\s*```', re.DOTALL),
+    re.compile(r'```tool_outputs\s*(.*?)\s*```', re.DOTALL),
+)
+
 
 class TravelAgent(BaseAgent):
     """Travel Agent backed by ADK."""
@@ -82,7 +89,7 @@ class TravelAgent(BaseAgent):
         async for chunk in self.runner.run_stream(
             self.agent, query, context_id
         ):
-            logger.info(f'Received chunk {chunk}')
+            logger.info('Received chunk %s', chunk)
             if isinstance(chunk, dict) and chunk.get('type') == 'final_result':
                 response = chunk['response']
                 yield self.get_agent_response(response)
@@ -94,14 +101,8 @@ class TravelAgent(BaseAgent):
                 }
 
     def format_response(self, chunk):
-        patterns = [
-            r'```\n(.*?)\n```',
-            r'```json\s*(.*?)\s*```',
-            r'```tool_outputs\s*(.*?)\s*```',
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, chunk, re.DOTALL)
+        for pattern in RESPONSE_BLOCK_PATTERNS:
+            match = pattern.search(chunk)
             if match:
                 content = match.group(1)
                 try:
@@ -111,9 +112,9 @@ class TravelAgent(BaseAgent):
         return chunk
 
     def get_agent_response(self, chunk):
-        logger.info(f'Response Type {type(chunk)}')
+        logger.info('Response Type %s', type(chunk))
         data = self.format_response(chunk)
-        logger.info(f'Formatted Response {data}')
+        logger.info('Formatted Response %s', data)
         try:
             if isinstance(data, dict):
                 if 'status' in data and data['status'] == 'input_required':
@@ -23,10 +23,18 @@ TaskUpdateCallback = Callable[[TaskCallbackArg, AgentCard], Task]
 class RemoteAgentConnections:
     """A class to hold the connections to the remote agents."""
 
-    def __init__(self, agent_card: AgentCard, agent_url: str):
+    def __init__(
+        self,
+        agent_card: AgentCard,
+        agent_url: str,
+        httpx_client: httpx.AsyncClient | None = None,
+    ):
         print(f'agent_card: {agent_card}')
         print(f'agent_url: {agent_url}')
-        self._httpx_client = httpx.AsyncClient(timeout=30)
+        # A shared httpx_client pools sockets bound to the event loop that first
+        # uses them, so it must not be used inside a temporary start-up loop
+        # such as asyncio.run(); the owner keeps it open for the process.
+        self._httpx_client = httpx_client or httpx.AsyncClient(timeout=30)
         self.agent_client = A2AClient(
             self._httpx_client, agent_card, url=agent_url
         )
@@ -89,6 +89,8 @@ class RoutingAgent:
         self.remote_agent_connections: dict[str, RemoteAgentConnections] = {}
         self.cards: dict[str, AgentCard] = {}
         self.agents: str = ''
+        # Shared by all remote connections; lives as long as the process.
+        self._httpx_client = httpx.AsyncClient(timeout=30)
         self.context = AzureAgentContext()
         
         # Initialize Azure AI Agents client
@@ -115,7 +117,9 @@ class RoutingAgent:
                     )  # get_agent_card is async
 
                     remote_connection = RemoteAgentConnections(
-                        agent_card=card, agent_url=address
+                        agent_card=card,
+                        agent_url=address,
+                        httpx_client=self._httpx_client,
                     )
                     self.remote_agent_connections[card.name] = remote_connection
                     self.cards[card.name] = card
@@ -4,8 +4,8 @@ AgentBob – command-line front-end for the toy A2A number-guessing game.
 Bob mediates between a human player and two peer agents:
 
 * **AgentAlice** – holds the secret number and grades guesses.
-* **AgentCarol** – produces textual visualisations (and optional shuffles)
-  of Bob's accumulated guess history.
+* **AgentCarol** – produces textual visualisations (and optional shuffles or
+  sorts) of Bob's accumulated guess history.
 """
 
 from __future__ import annotations
@@ -17,7 +17,7 @@ from typing import Any
 
 from a2a.types import Task, TaskState
 from config import AGENT_ALICE_PORT, AGENT_CAROL_PORT
-from utils.game_logic import is_sorted_history
+from utils.game_logic import is_sorted_history, sort_history
 from utils.protocol_wrappers import (
     cancel_task,
     extract_text,
@@ -32,7 +32,12 @@ from utils.protocol_wrappers import (
 
 game_history: list[dict[str, str]] = []
 
-MAX_NEGOTIATION_ATTEMPTS = 400  # Upper bound to avoid endless loops
+# Upper bound on shuffle round-trips; afterwards Bob sorts the history himself.
+MAX_NEGOTIATION_ATTEMPTS = 10
+
+# When True, Bob demonstrates multi-turn messaging by asking Carol to shuffle
+# until the history is sorted; when False, he asks her to sort it in one call.
+DEMO_SHUFFLE_NEGOTIATION = True
 
 
 def _start_shuffle_request() -> Task | None:
@@ -69,6 +74,9 @@ def _negotiate_sorted_history(
     loop sending either “Try again” or “Well done!” follow-ups depending on
     whether the returned list is sorted.
 
+    Random shuffling needs O(n!) attempts on average, so once *max_attempts*
+    is reached the task is cancelled and the history is sorted locally.
+
     Args:
         max_attempts: Upper bound on the number of reshuffle attempts before the
             task is cancelled to avoid an infinite loop.
@@ -77,6 +85,11 @@ def _negotiate_sorted_history(
         int: The number of messages sent to Carol during the negotiation.
     """
     attempts = 0
+    locally_sorted = sort_history(game_history)
+    if locally_sorted is None:
+        print('[Bob] History contains non-numeric guesses; skipping shuffle')
+        return attempts
+
     resp_task = _start_shuffle_request()
     if resp_task is None:
         return attempts
@@ -126,10 +139,37 @@ def _negotiate_sorted_history(
             f'[Bob] Reached maximum attempts ({max_attempts}). Cancelling task.'
         )
         cancel_task(AGENT_CAROL_PORT, resp_task.id)
+        game_history[:] = locally_sorted
+        print('[Bob] Sorted the history locally instead')
 
     return attempts
 
 
+def _print_visualisation(vis_text: str) -> None:
+    print("\n=== Carol's visualisation (sorted) ===")
+    print(vis_text)
+    print('============================\n')
+
+
+def _sort_and_visualise_history() -> None:
+    """Ask Carol to sort *game_history* and visualise it in one request."""
+    payload = json.dumps(
+        {'action': 'sort_and_visualise', 'history': game_history}
+    )
+    resp_obj = send_text(AGENT_CAROL_PORT, payload)  # type: ignore[arg-type]
+    try:
+        result = json.loads(extract_text(resp_obj))
+    except json.JSONDecodeError:
+        result = None
+    if not isinstance(result, dict):
+        print('[Bob] Unexpected response from Carol; skipping visualisation')
+        return
+    sorted_hist = result.get('sorted')
+    if isinstance(sorted_hist, list) and len(sorted_hist) == len(game_history):
+        game_history[:] = sorted_hist
+    _print_visualisation(result.get('visualisation', ''))
+
+
 def _handle_guess(guess: str) -> str:
     """Forward *guess* to Agent Alice and return her textual feedback."""
     resp_obj = send_text(AGENT_ALICE_PORT, guess)
@@ -141,10 +181,7 @@ def _handle_guess(guess: str) -> str:
 def _visualise_history() -> None:
     """Request and print a formatted visualisation of *game_history*."""
     vis_obj = send_text(AGENT_CAROL_PORT, json.dumps(game_history))
-    vis_text = extract_text(vis_obj)
-    print("\n=== Carol's visualisation (sorted) ===")
-    print(vis_text)
-    print('============================\n')
+    _print_visualisation(extract_text(vis_obj))
 
 
 def play_game() -> None:
@@ -159,13 +196,15 @@ def play_game() -> None:
         feedback = _handle_guess(user_input)
         game_history.append({'guess': user_input, 'response': feedback})
 
-        total_attempts = _negotiate_sorted_history()
-        if total_attempts:
-            print(
-                f'Asked Carol to re-do the visualisation {total_attempts} times'
-            )
-
-        _visualise_history()
+        if DEMO_SHUFFLE_NEGOTIATION:
+            total_attempts = _negotiate_sorted_history()
+            if total_attempts:
+                print(
+                    f'Asked Carol to re-do the visualisation {total_attempts} times'
+                )
+            _visualise_history()
+        else:
+            _sort_and_visualise_history()
 
         if feedback.startswith('correct'):
             break
@@ -1,13 +1,15 @@
 """agent_Carol.py
-AgentCarol – helper agent that visualises or shuffles Bob's guess history.
+AgentCarol – helper agent that visualises, sorts or shuffles Bob's guess history.
 
 Carol receives plain-text JSON payloads from AgentBob and returns either
-(1) a human-readable table of the guesses so far or (2) a JSON list with
-entries randomly shuffled, depending on the request.  This functionality
+(1) a human-readable table of the guesses so far, (2) a JSON list with
+entries randomly shuffled or (3) a JSON list sorted by guess, depending on
+the request.  This functionality
 is intentionally simple to keep the focus on A2A message flow.
 """
 
 import json
+import logging
 import random
 import uuid
 
@@ -25,6 +27,8 @@ from utils.game_logic import process_history_payload
 from utils.server import run_agent_blocking
 
 
+logger = logging.getLogger(__name__)
+
 # ------------------ Agent card ------------------
 
 carol_skills = [
@@ -48,6 +52,18 @@ carol_skills = [
             '{"action": "shuffle", "history": [{"guess": 25, "response": "Go higher"}]}'
         ],
     },
+    {
+        'id': 'history_sorter',
+        'name': 'Guess History Sorter',
+        'description': 'Sorts guess/response entries in a provided history list by guess and returns JSON, optionally together with its visualisation.',
+        'tags': ['sorting', 'demo'],
+        'inputModes': ['text/plain'],
+        'outputModes': ['text/plain'],
+        'examples': [
+            '{"action": "sort", "history": [{"guess": 25, "response": "Go higher"}]}',
+            '{"action": "sort_and_visualise", "history": [{"guess": 25, "response": "Go higher"}]}',
+        ],
+    },
 ]
 
 carol_card = AgentCard.model_validate(
@@ -77,12 +93,14 @@ class HistoryHelperExecutor(AgentExecutor):
 
     @staticmethod
     def _print_guesses(label: str, history: list[dict[str, Any]]) -> None:
-        """Utility: print only the numeric guesses in *history* for debugging."""
+        """Utility: log only the numeric guesses in *history* for debugging."""
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
         try:
             guesses = [int(item.get('guess', '?')) for item in history]
         except Exception:
             guesses = []
-        print(f'[Carol] {label}: {guesses}')
+        logger.debug('[Carol] %s: %s', label, guesses)
 
     def __init__(self) -> None:
         # Keep the last history list so we can reshuffle it on follow-up.
@@ -108,12 +126,12 @@ class HistoryHelperExecutor(AgentExecutor):
         )
 
         if raw_text.lower().startswith('well done'):
-            print('[Carol] Received well done – completing task')
+            logger.info('[Carol] Received well done – completing task')
             await updater.complete()
             return
 
         # Any other text → shuffle again and ask for more input
-        print('[Carol] Shuffling again and returning list')
+        logger.info('[Carol] Shuffling again and returning list')
         random.shuffle(self._last_history)
         # Debug print before sending back to Bob
         self._print_guesses('Shuffled list', self._last_history)
@@ -156,6 +174,14 @@ class HistoryHelperExecutor(AgentExecutor):
         except Exception:
             pass
         await updater.add_artifact([Part(root=TextPart(text=response_text))])
+        if (
+            success
+            and isinstance(parsed, dict)
+            and parsed.get('action') in ('sort', 'sort_and_visualise')
+        ):
+            # A sort needs no negotiation, so the task is done in one turn.
+            await updater.complete()
+            return
         # Ask Bob for further input
         await updater.requires_input(final=True)
 
@@ -182,8 +208,9 @@ class HistoryHelperExecutor(AgentExecutor):
     ) -> None:
         """Cancel the ongoing task on explicit request from a peer agent."""
         if context.task_id:
-            print(
-                f'[Carol] Task {context.task_id} canceled on request of peer agent'
+            logger.info(
+                '[Carol] Task %s canceled on request of peer agent',
+                context.task_id,
             )
             updater = TaskUpdater(
                 event_queue,
@@ -10,6 +10,7 @@ This module is transport-agnostic. It currently contains:
 from __future__ import annotations
 
 import json
+import logging
 import random
 
 from utils.helpers import parse_int_in_range, try_parse_json
@@ -20,8 +21,11 @@ __all__ = [
     'is_sorted_history',
     'process_guess',
     'process_history_payload',
+    'sort_history',
 ]
 
+logger = logging.getLogger(__name__)
+
 # ---------------------------------------------------------------------------
 # Number-guessing state (Alice)
 # ---------------------------------------------------------------------------
@@ -54,12 +58,12 @@ def process_guess(raw_text: str) -> str:
     global _attempts, _target_number, _secret_logged
 
     if not _secret_logged:
-        print('[GameLogic] Secret number selected. Waiting for guesses…')
+        logger.info('[GameLogic] Secret number selected. Waiting for guesses…')
         _secret_logged = True
 
     guess = parse_int_in_range(raw_text, 1, 100)
     if guess is None:
-        print(f"[GameLogic] Received invalid input '{raw_text}'.")
+        logger.info("[GameLogic] Received invalid input '%s'.", raw_text)
         return 'Please send a number between 1 and 100.'
 
     _attempts += 1
@@ -71,7 +75,7 @@ def process_guess(raw_text: str) -> str:
     else:
         hint = f'correct! attempts: {_attempts}'
 
-    print(f'[GameLogic] Guess {guess} -> {hint}')
+    logger.info('[GameLogic] Guess %s -> %s', guess, hint)
     return hint
 
 
@@ -98,7 +102,7 @@ def build_visualisation(history: list[dict[str, str]]) -> str:
         guess = entry.get('guess', '?')
         response = entry.get('response', '?')
         lines.append(f' {idx:>2}. {guess:>3} -> {response}')
-    print('[GameLogic] Created a visualisation for Bob')
+    logger.info('[GameLogic] Created a visualisation for Bob')
     return '\n'.join(lines)
 
 
@@ -118,15 +122,41 @@ def is_sorted_history(history: list[dict[str, str]]) -> bool:
     """
     # The history list can contain either dict entries (with a 'guess' key)
     # or bare numeric values when other agents reply with a simplified list.
+    if history and isinstance(history[0], dict):
+        guesses = (entry['guess'] for entry in history)
+    else:
+        # Assume iterable of plain numbers / numeric strings
+        guesses = iter(history)
+
+    # Single pass that stops at the first descent instead of sorting a copy.
+    previous = None
     try:
-        if history and isinstance(history[0], dict):
-            guesses = [int(entry['guess']) for entry in history]
-        else:
-            # Assume iterable of plain numbers / numeric strings
-            guesses = [int(entry) for entry in history]
+        for raw_guess in guesses:
+            guess = int(raw_guess)
+            if previous is not None and guess < previous:
+                return False
+            previous = guess
     except (ValueError, TypeError, KeyError):
         return False
-    return guesses == sorted(guesses)
+    return True
+
+
+def sort_history(
+    history: list[dict[str, str]],
+) -> list[dict[str, str]] | None:
+    """Return a copy of *history* ordered by the numeric value of each guess.
+
+    Args:
+        history: List of ``{"guess": str, "response": str}`` entries.
+
+    Returns:
+        list | None: The sorted copy, or ``None`` when any guess is not an
+        integer (such a history can never be sorted).
+    """
+    try:
+        return sorted(history, key=lambda entry: int(entry['guess']))
+    except (ValueError, TypeError, KeyError):
+        return None
 
 
 def process_history_payload(raw_text: str) -> str:
@@ -136,7 +166,13 @@ def process_history_payload(raw_text: str) -> str:
 
     1. ``{"action": "shuffle", "history": [...]}`` – The history list is
        shuffled in place and returned as a JSON string.
-    2. ``[ ... ]`` – The list is treated as a full history and formatted via
+    2. ``{"action": "sort", "history": [...]}`` – The history list is sorted
+       by guess and returned as a JSON string (left unchanged when a guess is
+       not numeric).
+    3. ``{"action": "sort_and_visualise", "history": [...]}`` – As ``sort``,
+       but returns ``{"sorted": [...], "visualisation": "..."}`` so Bob needs
+       a single round trip per turn.
+    4. ``[ ... ]`` – The list is treated as a full history and formatted via
        :func:`build_visualisation`.
 
     Any input that cannot be parsed as JSON yields an empty visualisation to
@@ -159,9 +195,30 @@ def process_history_payload(raw_text: str) -> str:
         if not isinstance(history_list, list):
             history_list = []
         random.shuffle(history_list)
-        print('[GameLogic] Shuffled history and returned JSON list')
+        logger.info('[GameLogic] Shuffled history and returned JSON list')
         return json.dumps(history_list)
 
+    # Sort requests (optionally combined with the visualisation)
+    if isinstance(parsed, dict) and parsed.get('action') in (
+        'sort',
+        'sort_and_visualise',
+    ):
+        history_list = parsed.get('history', [])
+        if not isinstance(history_list, list):
+            history_list = []
+        sorted_list = sort_history(history_list)
+        if sorted_list is not None:
+            history_list = sorted_list
+        if parsed['action'] == 'sort':
+            logger.info('[GameLogic] Sorted history and returned JSON list')
+            return json.dumps(history_list)
+        return json.dumps(
+            {
+                'sorted': history_list,
+                'visualisation': build_visualisation(history_list),
+            }
+        )
+
     # Visualisation request
     if isinstance(parsed, list):
         return build_visualisation(parsed)
@@ -6,6 +6,9 @@ Minimal helpers to create a Starlette app with `DefaultRequestHandler` and run U
 
 from __future__ import annotations
 
+import logging
+import sys
+
 import uvicorn  # type: ignore
 
 from a2a.server.apps.jsonrpc.starlette_app import A2AStarletteApplication
@@ -47,6 +50,26 @@ def build_starlette_app(
     ).build(rpc_url='/a2a/v1')
 
 
+# The agents run as scripts (``__main__``) and log game events under ``utils``.
+_AGENT_LOGGERS = ('__main__', 'utils')
+
+
+def _configure_agent_logging() -> None:
+    """Print the demo's own trace messages to stdout at INFO.
+
+    Only the sample's loggers are configured, so third-party INFO logs (httpx,
+    the SDK) stay out of the game transcript. Raise their level to silence the
+    agents' traces without touching the agents.
+    """
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter('%(message)s'))
+    for name in _AGENT_LOGGERS:
+        agent_logger = logging.getLogger(name)
+        agent_logger.setLevel(logging.INFO)
+        agent_logger.addHandler(handler)
+        agent_logger.propagate = False
+
+
 def run_agent_blocking(
     name: str,
     port: int,
@@ -62,6 +85,7 @@ def run_agent_blocking(
         agent_card: Metadata describing the agent (``dict`` or ``AgentCard``).
         executor: Instance of an ``AgentExecutor`` to handle requests.
     """
+    _configure_agent_logging()
     app = build_starlette_app(agent_card, executor=executor)
     print(f'{name} listening on http://localhost:{port}')
     uvicorn.run(app, host='127.0.0.1', port=port, log_level='error')
@@ -11,15 +11,23 @@ import pytest
 
 from a2a.client import A2ACardResolver, ClientConfig, create_client
 from a2a.helpers import display_agent_card
-from a2a.types import GetExtendedAgentCardRequest
+from a2a.types import AgentCard, GetExtendedAgentCardRequest
 from a2a.utils.constants import (
     AGENT_CARD_WELL_KNOWN_PATH,
 )
 from a2a.utils.signing import create_signature_verifier
 from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric.types import PublicKeyTypes
 from jwt.api_jwk import PyJWK
 
 
+# Parsed public keys keyed by (jku, key_id), so verifying several signatures
+# from the same agent costs one JKU fetch per TTL instead of one per signature.
+# Entries are dropped when verification fails (see verify_card_signature).
+_PUBLIC_KEY_TTL_SECONDS = 300.0
+_public_key_cache: dict[tuple[str, str], tuple[float, PublicKeyTypes]] = {}
+
+
 def _key_provider(key_id: str, jku: str) -> PyJWK | str | bytes:
     """Fetch and parse public key from JKU URL given key ID (key_id) and JKU URL."""
     if not isinstance(key_id, str) or not key_id:
@@ -27,6 +35,11 @@ def _key_provider(key_id: str, jku: str) -> PyJWK | str | bytes:
     if not isinstance(jku, str) or not jku:
         raise TypeError(f'Expected jku: str, but got: {type(jku).__name__} ({jku!r})')
 
+    now = time.monotonic()
+    cached = _public_key_cache.get((jku, key_id))
+    if cached is not None and now - cached[0] < _PUBLIC_KEY_TTL_SECONDS:
+        return cached[1]
+
     try:
         response = httpx.get(jku)
         response.raise_for_status()
@@ -39,11 +52,27 @@ def _key_provider(key_id: str, jku: str) -> PyJWK | str | bytes:
     if not pem_data_str:
         raise ValueError('Invalid JWK Key ID.')
 
-    return serialization.load_pem_public_key(pem_data_str.encode('utf-8'))
+    public_key = serialization.load_pem_public_key(pem_data_str.encode('utf-8'))
+    _public_key_cache[(jku, key_id)] = (now, public_key)
+    return public_key
 
 
 # Create a verifier function to validate AgentCard JWS signatures
-verify_card_signature = create_signature_verifier(_key_provider, ['ES256'])
+_verify_card_signature = create_signature_verifier(_key_provider, ['ES256'])
+
+
+def verify_card_signature(card: AgentCard) -> None:
+    """Verify the JWS signatures on `card`, forgetting cached keys on failure.
+
+    A failure may mean the agent rotated the key behind a cached (jku, key_id),
+    so the next verification fetches the keys again instead of failing until
+    the cache entry expires.
+    """
+    try:
+        _verify_card_signature(card)
+    except Exception:
+        _public_key_cache.clear()
+        raise
 
 
 async def main() -> None:
@@ -28,10 +28,18 @@ logger.setLevel(logging.DEBUG)
 class RemoteAgentConnections:
     """A class to hold the connections to the remote agents."""
 
-    def __init__(self, agent_card: AgentCard, agent_url: str):
+    def __init__(
+        self,
+        agent_card: AgentCard,
+        agent_url: str,
+        httpx_client: httpx.AsyncClient | None = None,
+    ):
         logger.debug(f'agent_card: {agent_card}')
         logger.debug(f'agent_url: {agent_url}')
-        self._httpx_client = httpx.AsyncClient(timeout=30)
+        # A shared httpx_client pools sockets bound to the event loop that first
+        # uses them, so it must not be used inside a temporary start-up loop
+        # such as asyncio.run(); the owner keeps it open for the process.
+        self._httpx_client = httpx_client or httpx.AsyncClient(timeout=30)
         self.agent_client = A2AClient(
             self._httpx_client, agent_card, url=agent_url
         )
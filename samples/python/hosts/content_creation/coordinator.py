@@ -83,6 +83,8 @@ class CoordinatorAgent:
         self.remote_agent_connections: dict[str, RemoteAgentConnections] = {}
         self.cards: dict[str, AgentCard] = {}
         self.agents: str = ''
+        # Shared by all remote connections; lives as long as the process.
+        self._httpx_client = httpx.AsyncClient(timeout=30)
 
     async def _async_init_components(
         self, remote_agent_addresses: list[str]
@@ -100,7 +102,9 @@ class CoordinatorAgent:
                     )  # get_agent_card is async
 
                     remote_connection = RemoteAgentConnections(
-                        agent_card=card, agent_url=address
+                        agent_card=card,
+                        agent_url=address,
+                        httpx_client=self._httpx_client,
                     )
                     self.remote_agent_connections[card.name] = remote_connection
                     self.cards[card.name] = card